@@ -1,19 +1,38 @@
 #!/usr/bin/env python3
 """
-Flask backend for UCSD Podcast Transcriber Web App
+Quart backend for UCSD Podcast Transcriber Web App
 """
 
+import asyncio
+import base64
+import functools
+import itertools
+import logging
 import os
+import queue
+import re
 import sys
-import uuid
 import threading
 import time
+from concurrent.futures import Future
 from datetime import datetime
 from pathlib import Path
-from flask import Flask, request, jsonify, send_file, send_from_directory
-from flask_cors import CORS
+import aiofiles
+import orjson
+from quart import Quart, Response, request, jsonify, send_file
+from quart.json.provider import JSONProvider
+from quart_cors import cors
+from cachetools import TTLCache
 from werkzeug.utils import secure_filename
 
+# Optional Redis-backed job queue (enabled by setting REDIS_URL)
+try:
+    import redis
+    import redis.asyncio
+    from rq import Queue
+except ImportError:
+    redis = None
+
 # Import the transcriber functions
 from ucsd_podcast_transcriber import (
     transcribe_podcast,
@@ -21,15 +40,145 @@ from ucsd_podcast_transcriber import (
     download_audio,
     transcribe_audio,
     clean_transcript,
-    save_transcript
+    save_transcript,
+    quit_driver
 )
 
-app = Flask(__name__, static_folder='static', static_url_path='')
-CORS(app)
 
-# Store job status in memory (in production, use Redis or database)
-jobs = {}
-transcripts = {}
+class ORJSONProvider(JSONProvider):
+    """JSON provider backed by orjson, which also serializes datetimes natively."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+app = Quart(__name__, static_folder='static', static_url_path='')
+app.json = ORJSONProvider(app)
+app = cors(app)
+
+# How long finished jobs are remembered, in memory and in Redis
+JOB_TTL_SECONDS = 7 * 24 * 3600
+JOB_TIMEOUT_SECONDS = 2 * 3600
+
+# Serialized /api/status responses are cached in Redis (status:<id>) so
+# clients polling every few seconds are answered with a single GET
+STATUS_CACHE_TTL_SECONDS = 5
+
+# Store job status in memory (in production, set REDIS_URL to use Redis).
+# Finished jobs and transcripts are kept in bounded caches so a long-running
+# server doesn't keep them forever; transcripts can always be re-read from
+# disk. Queued and running jobs live in active_jobs until they finish, so a
+# full cache can't evict a job that is still in progress.
+# TTLCache isn't thread-safe, so all access goes through store_lock.
+active_jobs = {}
+jobs = TTLCache(maxsize=500, ttl=JOB_TTL_SECONDS)
+transcripts = TTLCache(maxsize=100, ttl=3600)
+store_lock = threading.Lock()
+
+
+def lookup_job(job_id):
+    """Return the job from this process's in-memory stores, or None."""
+    with store_lock:
+        job = active_jobs.get(job_id)
+        return job if job is not None else jobs.get(job_id)
+
+
+# Worker threads update job fields while request handlers read them, so each
+# group of updates and each snapshot is taken under the job's lock. Locks are
+# striped by job id to avoid one lock per job.
+JOB_LOCKS = [threading.Lock() for _ in range(16)]
+
+
+def job_lock(job_id):
+    """Return the lock guarding the given job's fields."""
+    return JOB_LOCKS[hash(job_id) & 15]
+
+
+# When REDIS_URL is set, jobs are queued to `rq worker` processes and their
+# state lives in Redis hashes (job:<id>) instead of this process
+REDIS_URL = os.environ.get("REDIS_URL")
+
+redis_conn = None  # Used by worker threads/processes
+async_redis_conn = None  # Used by request handlers
+job_queue = None
+
+if REDIS_URL:
+    if redis is None:
+        print("⚠️  REDIS_URL is set but redis/rq are not installed; "
+              "running jobs in-process", file=sys.stderr)
+    else:
+        redis_conn = redis.Redis.from_url(REDIS_URL)
+        async_redis_conn = redis.asyncio.Redis.from_url(REDIS_URL)
+        job_queue = Queue("transcribe", connection=redis_conn)
+
+
+class DaemonThreadPool:
+    """
+    Fixed-size pool of reusable daemon worker threads.
+
+    concurrent.futures.ThreadPoolExecutor joins its workers at interpreter
+    exit, so a running transcription would keep the server alive after
+    Ctrl+C. These workers are daemon threads and are dropped on shutdown.
+    """
+
+    def __init__(self, max_workers, thread_name_prefix):
+        self._max_workers = max_workers
+        self._thread_name_prefix = thread_name_prefix
+        self._tasks = queue.SimpleQueue()
+        self._threads = []
+        self._lock = threading.Lock()
+
+    def submit(self, fn, *args):
+        """Schedule fn(*args) on a worker thread and return its Future."""
+        future = Future()
+        self._tasks.put((future, fn, args))
+        self._adjust_thread_count()
+        return future
+
+    def _adjust_thread_count(self):
+        with self._lock:
+            if len(self._threads) < self._max_workers:
+                thread = threading.Thread(
+                    target=self._worker,
+                    name=f"{self._thread_name_prefix}_{len(self._threads)}"
+                )
+                thread.daemon = True
+                thread.start()
+                self._threads.append(thread)
+
+    def _worker(self):
+        while True:
+            future, fn, args = self._tasks.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+
+# Transcriptions beyond this limit wait in the "queued" state
+MAX_CONCURRENT_JOBS = 4
+EXECUTOR = DaemonThreadPool(max_workers=MAX_CONCURRENT_JOBS, thread_name_prefix="transcribe")
+
+# Deleting large audio files can be slow, so it happens off the job's thread
+CLEANUP_POOL = DaemonThreadPool(max_workers=2, thread_name_prefix="cleanup")
+
+
+def remove_audio_file(path):
+    """Delete a temporary audio file, ignoring files that are already gone."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        app.logger.warning("Failed to remove audio file %s: %s", path, e)
+
 
 # Create output directory for transcripts
 OUTPUT_DIR = Path("transcripts")
@@ -38,10 +187,68 @@ OUTPUT_DIR.mkdir(exist_ok=True)
 AUDIO_DIR = Path("audio_temp")
 AUDIO_DIR.mkdir(exist_ok=True)
 
+# Request validation
+MODEL_NAMES = ('tiny', 'base', 'small', 'medium', 'large')
+VALID_MODELS = frozenset(MODEL_NAMES)
+URL_RE = re.compile(r'https?://\S+')  # Use with .fullmatch()
+
+# Common locations for quick access in the folder browser (computed once)
+QUICK_ACCESS = [
+    {"name": folder_name, "path": str(Path.home() / folder_name)}
+    for folder_name in ('Documents', 'Desktop', 'Downloads')
+    if (Path.home() / folder_name).is_dir()
+]
+
+
+@functools.lru_cache(maxsize=256)
+def resolve_path(path):
+    """
+    Resolve a folder-browser path, caching the result.
+
+    Path.resolve() does a readlink per path component, which is slow on
+    network mounts; the UI keeps navigating within the same few folders.
+    """
+    return Path(path).resolve()
+
+
+# Job ids count up from the process start time in microseconds, so they are
+# unique across restarts without a random UUID per job
+_job_counter = itertools.count(int(time.time() * 1e6))
+
+
+def new_job_id():
+    """Return a short, unique job id (13 lowercase base32 characters)."""
+    return base64.b32encode(next(_job_counter).to_bytes(8, 'big')).decode().rstrip('=').lower()
+
+
+def _timestamp_property(name):
+    """Datetime attribute that also caches its ISO string for to_dict()."""
+    attr, iso_attr = f"_{name}", f"_{name}_iso"
+
+    def getter(self):
+        return getattr(self, attr)
+
+    def setter(self, value):
+        setattr(self, attr, value)
+        setattr(self, iso_attr, value.isoformat() if value else None)
+
+    return property(getter, setter)
+
 
 class TranscriptionJob:
     """Represents a transcription job with progress tracking."""
 
+    # Jobs are kept for days, so skip the per-instance __dict__
+    __slots__ = ("job_id", "url", "model", "output_folder", "status", "progress",
+                 "eta_minutes", "error", "transcript_path", "transcript_preview",
+                 "_created_at", "_created_at_iso", "_started_at", "_started_at_iso",
+                 "_completed_at", "_completed_at_iso")
+
+    # Status polls call to_dict() constantly, so format timestamps once per change
+    created_at = _timestamp_property("created_at")
+    started_at = _timestamp_property("started_at")
+    completed_at = _timestamp_property("completed_at")
+
     def __init__(self, job_id, url, model, output_folder=None):
         self.job_id = job_id
         self.url = url
@@ -68,11 +275,61 @@ class TranscriptionJob:
             "eta_minutes": self.eta_minutes,
             "error": self.error,
             "transcript_preview": self.transcript_preview,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "created_at": self._created_at_iso,
+            "started_at": self._started_at_iso,
+            "completed_at": self._completed_at_iso,
         }
 
+    def to_fields(self):
+        """Convert job to a flat mapping for the Redis job hash."""
+        fields = self.to_dict()
+        fields["output_folder"] = self.output_folder
+        fields["transcript_path"] = self.transcript_path
+        return {key: orjson.dumps(value) for key, value in fields.items()}
+
+    @classmethod
+    def from_fields(cls, fields):
+        """Rebuild a job from a Redis job hash."""
+        data = {key.decode(): orjson.loads(value) for key, value in fields.items()}
+        job = cls(data["job_id"], data["url"], data["model"], data.get("output_folder"))
+        for name in ("status", "progress", "eta_minutes", "error",
+                     "transcript_path", "transcript_preview"):
+            setattr(job, name, data.get(name))
+        for name in ("created_at", "started_at", "completed_at"):
+            value = data.get(name)
+            setattr(job, name, datetime.fromisoformat(value) if value else None)
+        return job
+
+
+def save_job(job):
+    """Publish job state to Redis so other processes can read it."""
+    if redis_conn is None:
+        return
+
+    with job_lock(job.job_id):
+        fields = job.to_fields()
+        status = orjson.dumps(job.to_dict())
+
+    key = f"job:{job.job_id}"
+    try:
+        pipe = redis_conn.pipeline()
+        pipe.hset(key, mapping=fields)
+        pipe.expire(key, JOB_TTL_SECONDS)
+        pipe.set(f"status:{job.job_id}", status, ex=STATUS_CACHE_TTL_SECONDS)
+        pipe.execute()
+    except redis.RedisError as e:
+        print(f"Failed to save job {job.job_id} to Redis: {e}", file=sys.stderr)
+
+
+async def get_job(job_id):
+    """Look up a job in this process, falling back to the Redis job hash."""
+    job = lookup_job(job_id)
+    if job is None and async_redis_conn is not None:
+        fields = await async_redis_conn.hgetall(f"job:{job_id}")
+        if fields:
+            job = TranscriptionJob.from_fields(fields)
+    return job
+
 
 def estimate_time(model, audio_duration_minutes=60):
     """
@@ -89,103 +346,189 @@ def estimate_time(model, audio_duration_minutes=60):
     return estimates.get(model, 25)
 
 
-def run_transcription(job_id):
+def run_transcription(job_id, background_cleanup=True):
     """
-    Run the transcription in a background thread.
+    Run the transcription in a worker thread (off the event loop).
     Updates job status throughout the process.
+
+    With background_cleanup=False the audio file is deleted before returning,
+    for processes that may exit before the cleanup pool gets to it.
     """
-    job = jobs.get(job_id)
+    job = lookup_job(job_id)
     if not job:
         return
 
     try:
-        job.started_at = datetime.now()
-        job.status = "capturing"
-        job.progress = 5
+        with job_lock(job_id):
+            job.started_at = datetime.now()
+            job.status = "capturing"
+            job.progress = 5
 
-        # Step 1: Download audio
-        job.status = "downloading"
-        job.progress = 10
-        job.eta_minutes = estimate_time(job.model)
+            # Step 1: Download audio
+            job.status = "downloading"
+            job.progress = 10
+            job.eta_minutes = estimate_time(job.model)
+        save_job(job)
 
         audio_path = download_audio(job.url, str(AUDIO_DIR))
 
-        job.progress = 30
+        with job_lock(job_id):
+            job.progress = 30
 
-        # Step 2: Transcribe
-        job.status = "transcribing"
-        job.progress = 40
+            # Step 2: Transcribe
+            job.status = "transcribing"
+            job.progress = 40
+        save_job(job)
 
         transcript = transcribe_audio(audio_path, job.model)
 
-        job.progress = 80
+        with job_lock(job_id):
+            job.progress = 80
 
-        # Step 3: Clean transcript
-        job.status = "cleaning"
-        job.progress = 85
+            # Step 3: Clean transcript
+            job.status = "cleaning"
+            job.progress = 85
+        save_job(job)
 
         transcript = clean_transcript(transcript)
 
         # Step 4: Save transcript
-        job.progress = 90
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_filename = f"transcript_{timestamp}_{job_id[:8]}.txt"
+        with job_lock(job_id):
+            job.progress = 90
+        save_job(job)
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        output_filename = f"transcript_{timestamp}_{job_id}.txt"
 
         # Use custom output folder if specified, otherwise use default
         if job.output_folder:
             output_dir = Path(job.output_folder)
             output_dir.mkdir(parents=True, exist_ok=True)
             output_path = output_dir / output_filename
-            print(f"[DEBUG] Saving transcript to custom folder: {output_path}", file=sys.stderr)
         else:
             output_path = OUTPUT_DIR / output_filename
-            print(f"[DEBUG] Saving transcript to default folder: {output_path}", file=sys.stderr)
+        app.logger.debug("Saving transcript to %s folder: %s",
+                         "custom" if job.output_folder else "default", output_path)
 
         save_transcript(transcript, str(output_path))
-        print(f"[DEBUG] Transcript successfully saved to: {output_path}", file=sys.stderr)
+        app.logger.debug("Transcript successfully saved to: %s", output_path)
 
-        # Clean up audio file
-        try:
-            os.remove(audio_path)
-        except:
-            pass
+        # Clean up audio file in the background
+        if background_cleanup:
+            CLEANUP_POOL.submit(remove_audio_file, audio_path)
+        else:
+            remove_audio_file(audio_path)
 
         # Store results
-        job.status = "complete"
-        job.progress = 100
-        job.eta_minutes = 0
-        job.transcript_path = str(output_path)
-        job.transcript_preview = transcript[:500] if len(transcript) > 500 else transcript
-        job.completed_at = datetime.now()
-
-        # Cache the full transcript
-        transcripts[job_id] = transcript
+        with job_lock(job_id):
+            job.status = "complete"
+            job.progress = 100
+            job.eta_minutes = 0
+            job.transcript_path = str(output_path)
+            job.transcript_preview = transcript[:500]
+            job.completed_at = datetime.now()
+        save_job(job)
+
+        # Cache the transcript until it is first fetched
+        with store_lock:
+            transcripts[job_id] = transcript
 
     except Exception as e:
-        job.status = "error"
-        job.error = str(e)
-        job.progress = 0
+        with job_lock(job_id):
+            job.status = "error"
+            job.error = str(e)
+            job.progress = 0
+        save_job(job)
         print(f"Error in transcription job {job_id}: {e}", file=sys.stderr)
 
+    finally:
+        # Finished jobs move to the bounded cache, where they can be evicted
+        with store_lock:
+            active_jobs.pop(job_id, None)
+            jobs[job_id] = job
+
+
+def run_transcription_task(job_id, url, model, output_folder=None):
+    """
+    Run a queued job inside an `rq worker` process.
+
+    The job hash written by the web process is loaded so the job keeps its
+    creation time; the local copy is dropped once the job finishes.
+    """
+    fields = redis_conn.hgetall(f"job:{job_id}") if redis_conn is not None else None
+    if fields:
+        job = TranscriptionJob.from_fields(fields)
+    else:
+        job = TranscriptionJob(job_id, url, model, output_folder)
+    with store_lock:
+        active_jobs[job_id] = job
+
+    try:
+        # The work-horse ends with os._exit() right after this returns, which
+        # would kill a pending background cleanup, so delete the audio inline
+        run_transcription(job_id, background_cleanup=False)
+    finally:
+        with store_lock:
+            active_jobs.pop(job_id, None)
+            jobs.pop(job_id, None)
+            transcripts.pop(job_id, None)
+
+        # os._exit() also skips atexit, so the shared browser is closed here
+        quit_driver()
+
+    return job.status
+
+
+def enqueue_job(job):
+    """Persist a new job to Redis and hand it to the RQ workers."""
+    save_job(job)
+    try:
+        # Enqueue by import path: RQ refuses functions from __main__, which is
+        # what this module is when started as `python3 app.py`
+        job_queue.enqueue(
+            "app.run_transcription_task",
+            args=(job.job_id, job.url, job.model, job.output_folder),
+            job_id=job.job_id,
+            job_timeout=JOB_TIMEOUT_SECONDS
+        )
+    except Exception:
+        # Don't leave a job that will never run sitting at "queued"
+        redis_conn.delete(f"job:{job.job_id}", f"status:{job.job_id}")
+        raise
+
+
+if redis is not None:
+    @app.errorhandler(redis.RedisError)
+    async def handle_redis_error(error):
+        """In Redis mode there is no local copy of the jobs to fall back to."""
+        app.logger.error("Redis error: %s", error)
+        return jsonify({"error": "Job store unavailable, try again shortly"}), 503
+
 
 @app.route('/')
-def index():
+async def index():
     """Serve the main HTML page."""
-    return send_from_directory('static', 'index.html')
+    return await app.send_static_file('index.html')
 
 
 @app.route('/api/check-dependencies', methods=['GET'])
-def api_check_dependencies():
+async def api_check_dependencies():
     """Check if all required dependencies are installed."""
     try:
-        check_dependencies()
+        await asyncio.to_thread(check_dependencies)
         return jsonify({"status": "ok", "message": "All dependencies are installed"})
+    except SystemExit:
+        # check_dependencies() exits the CLI after printing what is missing;
+        # left uncaught, SystemExit would stop the whole server
+        return jsonify({
+            "status": "error",
+            "message": "Missing dependencies (FFmpeg or Python packages); see the server log for details"
+        }), 500
     except Exception as e:
         return jsonify({"status": "error", "message": str(e)}), 500
 
 
 @app.route('/api/transcribe', methods=['POST'])
-def api_transcribe():
+async def api_transcribe():
     """
     Start a new transcription job.
 
@@ -198,10 +541,10 @@ def api_transcribe():
 
     Returns:
     {
-        "job_id": "uuid"
+        "job_id": "job id"
     }
     """
-    data = request.get_json()
+    data = await request.get_json()
 
     if not data or 'url' not in data:
         return jsonify({"error": "Missing 'url' parameter"}), 400
@@ -211,12 +554,11 @@ def api_transcribe():
     output_folder = data.get('output_folder', '').strip()
 
     # Validate model
-    valid_models = ['tiny', 'base', 'small', 'medium', 'large']
-    if model not in valid_models:
-        return jsonify({"error": f"Invalid model. Must be one of: {', '.join(valid_models)}"}), 400
+    if not isinstance(model, str) or model not in VALID_MODELS:
+        return jsonify({"error": f"Invalid model. Must be one of: {', '.join(MODEL_NAMES)}"}), 400
 
     # Validate URL
-    if not url.startswith('http'):
+    if not isinstance(url, str) or not URL_RE.fullmatch(url):
         return jsonify({"error": "Invalid URL format"}), 400
 
     # Validate output folder if provided
@@ -234,20 +576,25 @@ def api_transcribe():
         output_folder = None
 
     # Create job
-    job_id = str(uuid.uuid4())
+    job_id = new_job_id()
     job = TranscriptionJob(job_id, url, model, output_folder)
-    jobs[job_id] = job
 
-    # Start transcription in background thread
-    thread = threading.Thread(target=run_transcription, args=(job_id,))
-    thread.daemon = True
-    thread.start()
+    if job_queue is not None:
+        # Queue the job for an `rq worker` process
+        await asyncio.to_thread(enqueue_job, job)
+        return jsonify({"job_id": job_id})
+
+    with store_lock:
+        active_jobs[job_id] = job
+
+    # Run the blocking transcription on the worker pool so the event loop stays free
+    EXECUTOR.submit(run_transcription, job_id)
 
     return jsonify({"job_id": job_id})
 
 
 @app.route('/api/status/<job_id>', methods=['GET'])
-def api_status(job_id):
+async def api_status(job_id):
     """
     Get the status of a transcription job.
 
@@ -260,59 +607,89 @@ def api_status(job_id):
         "error": "error message if failed"
     }
     """
-    job = jobs.get(job_id)
+    status_key = f"status:{job_id}"
+
+    if async_redis_conn is not None:
+        cached = await async_redis_conn.get(status_key)
+        if cached:
+            return Response(cached, mimetype='application/json')
+
+    job = await get_job(job_id)
 
     if not job:
         return jsonify({"error": "Job not found"}), 404
 
-    return jsonify(job.to_dict())
+    with job_lock(job_id):
+        status = job.to_dict()
+
+    # Workers refresh the cached status on every change; this covers pollers
+    # arriving between changes once the previous entry has expired. nx=True
+    # keeps a worker's fresher status if it was written since the hash was read
+    if async_redis_conn is not None:
+        try:
+            await async_redis_conn.set(status_key, orjson.dumps(status), ex=STATUS_CACHE_TTL_SECONDS, nx=True)
+        except redis.RedisError:
+            pass
+
+    return jsonify(status)
 
 
 @app.route('/api/download/<job_id>', methods=['GET'])
-def api_download(job_id):
+async def api_download(job_id):
     """
     Download the transcript file.
     """
-    job = jobs.get(job_id)
+    job = await get_job(job_id)
 
     if not job:
         return jsonify({"error": "Job not found"}), 404
 
-    if job.status != "complete":
+    with job_lock(job_id):
+        status, transcript_path = job.status, job.transcript_path
+
+    if status != "complete":
         return jsonify({"error": "Transcription not complete yet"}), 400
 
-    if not job.transcript_path or not os.path.exists(job.transcript_path):
+    if not transcript_path or not os.path.exists(transcript_path):
         return jsonify({"error": "Transcript file not found"}), 404
 
-    return send_file(
-        job.transcript_path,
+    # conditional=True answers If-None-Match/Range requests (304/206), and the
+    # file is streamed in chunks rather than read into memory
+    return await send_file(
+        transcript_path,
         as_attachment=True,
-        download_name=f"transcript_{job_id[:8]}.txt",
-        mimetype='text/plain'
+        attachment_filename=f"transcript_{job_id}.txt",
+        mimetype='text/plain',
+        conditional=True,
+        cache_timeout=0
     )
 
 
 @app.route('/api/transcript/<job_id>', methods=['GET'])
-def api_get_transcript(job_id):
+async def api_get_transcript(job_id):
     """
     Get the full transcript text as JSON.
     """
-    job = jobs.get(job_id)
+    job = await get_job(job_id)
 
     if not job:
         return jsonify({"error": "Job not found"}), 404
 
-    if job.status != "complete":
+    with job_lock(job_id):
+        status, transcript_path = job.status, job.transcript_path
+
+    if status != "complete":
         return jsonify({"error": "Transcription not complete yet"}), 400
 
-    transcript = transcripts.get(job_id)
+    # Serve the cached copy once, then drop it; later requests read the file
+    with store_lock:
+        transcript = transcripts.pop(job_id, None)
 
     if not transcript:
         # Try to read from file
-        if job.transcript_path and os.path.exists(job.transcript_path):
-            with open(job.transcript_path, 'r', encoding='utf-8') as f:
-                transcript = f.read()
-                transcripts[job_id] = transcript
+        if transcript_path and os.path.exists(transcript_path):
+            async with aiofiles.open(transcript_path, 'r', encoding='utf-8') as f:
+                transcript = await f.read()
         else:
             return jsonify({"error": "Transcript not found"}), 404
 
@@ -325,17 +702,42 @@ def api_get_transcript(job_id):
 
 
 @app.route('/api/jobs', methods=['GET'])
-def api_list_jobs():
+async def api_list_jobs():
     """
     List all jobs (for debugging/admin).
+
+    The response is streamed one job at a time, so memory use doesn't grow
+    with the number of jobs.
     """
-    return jsonify({
-        "jobs": [job.to_dict() for job in jobs.values()]
-    })
+    with store_lock:
+        local_jobs = list(active_jobs.values()) + list(jobs.values())
+
+    async def generate():
+        yield b'{"jobs":['
+        first = True
+        for job in local_jobs:
+            if not first:
+                yield b','
+            first = False
+            with job_lock(job.job_id):
+                status = job.to_dict()
+            yield orjson.dumps(status)
+
+        if async_redis_conn is not None:
+            async for key in async_redis_conn.scan_iter(match="job:*"):
+                fields = await async_redis_conn.hgetall(key)
+                if fields:
+                    if not first:
+                        yield b','
+                    first = False
+                    yield orjson.dumps(TranscriptionJob.from_fields(fields).to_dict())
+        yield b']}'
+
+    return Response(generate(), mimetype='application/json')
 
 
 @app.route('/api/browse-folders', methods=['POST'])
-def api_browse_folders():
+async def api_browse_folders():
     """
     Browse folders on the local file system.
 
@@ -351,7 +753,7 @@ def api_browse_folders():
         "folders": [{"name": "folder1", "path": "/path/to/folder1"}, ...]
     }
     """
-    data = request.get_json() or {}
+    data = await request.get_json() or {}
     requested_path = data.get('path', '').strip()
 
     # Default to user's home directory
@@ -362,7 +764,7 @@ def api_browse_folders():
         requested_path = os.path.expanduser(requested_path)
 
     try:
-        current_path = Path(requested_path).resolve()
+        current_path = resolve_path(requested_path)
 
         # Security check: ensure path exists and is a directory
         if not current_path.exists():
@@ -375,34 +777,23 @@ def api_browse_folders():
         parent_path = str(current_path.parent) if current_path.parent != current_path else None
 
         # List folders in current directory
-        folders = []
+        # scandir's DirEntry.is_dir() uses the file type from the directory
+        # listing, so only symlinks need an extra stat
         try:
-            for item in sorted(current_path.iterdir()):
-                if item.is_dir() and not item.name.startswith('.'):
-                    folders.append({
-                        "name": item.name,
-                        "path": str(item)
-                    })
+            with os.scandir(current_path) as it:
+                dirs = [entry for entry in it
+                        if not entry.name.startswith('.') and entry.is_dir()]
         except PermissionError:
             return jsonify({"error": "Permission denied to read this directory"}), 403
 
-        # Add common locations for quick access
-        quick_access = []
-        home = Path.home()
-        common_folders = ['Documents', 'Desktop', 'Downloads']
-        for folder_name in common_folders:
-            folder_path = home / folder_name
-            if folder_path.exists() and folder_path.is_dir():
-                quick_access.append({
-                    "name": folder_name,
-                    "path": str(folder_path)
-                })
+        dirs.sort(key=lambda entry: entry.name)
+        folders = [{"name": entry.name, "path": entry.path} for entry in dirs]
 
         return jsonify({
             "current_path": str(current_path),
             "parent_path": parent_path,
             "folders": folders,
-            "quick_access": quick_access
+            "quick_access": QUICK_ACCESS
         })
 
     except Exception as e:
@@ -410,15 +801,19 @@ def api_browse_folders():
 
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+
     print("=" * 60)
     print("🎓 UCSD Podcast Transcriber - Web Interface")
     print("=" * 60)
     print()
-    print("Starting Flask server...")
+    print("Starting Quart server...")
     print("Open your browser to: http://localhost:8080")
     print()
     print("Press Ctrl+C to stop the server")
     print("=" * 60)
     print()
 
-    app.run(debug=True, host='0.0.0.0', port=8080, threaded=True)
+    # For deployment, run under Hypercorn instead:
+    #   hypercorn app:app --bind 0.0.0.0:8080 --workers 1 --worker-class asyncio
+    app.run(debug=True, host='0.0.0.0', port=8080)
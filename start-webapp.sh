@@ -35,7 +35,7 @@ else
     echo ""
 fi
 
-echo "🚀 Starting Flask server..."
+echo "🚀 Starting Quart server..."
 echo ""
 
 # Start the app
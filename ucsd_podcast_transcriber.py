@@ -2,11 +2,11 @@
 """
 UCSD Podcast Transcriber
 ========================
-A tool to download and transcribe UCSD podcasts using OpenAI Whisper.
+A tool to download and transcribe UCSD podcasts using Whisper (via faster-whisper).
 Handles UCSD's Kaltura-based video system by capturing m3u8 streams.
 
 Requirements:
-    pip install openai-whisper selenium webdriver-manager
+    pip install faster-whisper soundfile selenium webdriver-manager
 
 Usage:
     python ucsd_podcast_transcriber.py <podcast_url> [options]
@@ -17,26 +17,146 @@ Examples:
 """
 
 import argparse
+import atexit
+import functools
+import gc
 import json
 import os
+import queue
 import re
+import shutil
 import subprocess
 import sys
 import tempfile
+import threading
 import time
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
+
+# Where transcripts are saved when no output path is given
+DEFAULT_OUTPUT_DIR = "/Users/atjon/Desktop/Code/COGS108Lectures"
+
+# Podcasts downloaded in parallel by transcribe_batch (downloads are network-bound)
+BATCH_DOWNLOAD_WORKERS = 4
+
+# JSONP query parameters that break FFmpeg, stripped by clean_m3u8_url()
+_PARAMS_TO_REMOVE = frozenset({'callback', 'responseFormat', '_'})
+
+# Stream URL checks for is_valid_m3u8_url()
+_JSONP_RE = re.compile(r'(?=.*callback=)(?=.*responseFormat=jsonp)')  # Use with .match()
+_M3U8_RE = re.compile(r'\.m3u8(?:[?#]|$)')  # .m3u8 path, before any query or fragment
+
+# FFmpeg is killed if a download takes longer than this
+FFMPEG_TIMEOUT_SECONDS = 600
+
+# Progress in FFmpeg's stats line, e.g. "size=  1024kB time=00:12:34.56 bitrate=..."
+_FFMPEG_TIME_RE = re.compile(r'time=(\d+:\d\d:\d\d)')
+
+# Transcript cleanup patterns, compiled once for clean_transcript()
+
+# Common Whisper hallucination patterns (non-English characters and gibberish).
+# Stripping foreign-script characters can join the Latin letters around them
+# into a new word (e.g. "te가u" -> "teu"), so the word-level patterns run in a
+# second pass over the result
+_FOREIGN_SCRIPT_PATTERNS = [
+    r'[가-힣]+',  # Korean characters
+    r'[一-龯]+',  # Chinese characters
+    r'[ぁ-んァ-ン]+',  # Japanese characters
+    r'[а-яА-Я]+',  # Cyrillic characters
+]
+_GIBBERISH_WORD_PATTERNS = [
+    r'\b[A-Z]?[a-z]*[äöüáéíóúàèìòùâêîôûãõñ][a-z]*\b',  # Words with accented chars (hallucinations)
+    r"\b(sy'n|gyms|gyflen|newidda|roedd|gwilia|gyfly|canyan|ayag|teu|aun)\b",  # Welsh-like gibberish
+    r'\bIag\b',  # Common hallucination
+]
+
+# Each group as one alternation, so removal is two passes instead of seven
+_HALLUCINATION_PASSES = [
+    re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+    for patterns in (_FOREIGN_SCRIPT_PATTERNS, _GIBBERISH_WORD_PATTERNS)
+]
+
+# Patterns that indicate the lecture has started (matched against lowercased sentences)
+_LECTURE_START_PATTERNS = [
+    r'(?:okay|alright|so|well|hey|hi|hello)?,?\s*my friends',
+    r'(?:okay|alright|so|well)?,?\s*today',
+    r'welcome\s+(?:to|back|everyone)',
+    r'(?:good\s+)?(?:morning|afternoon|evening)',
+    r"let's\s+(?:get\s+started|begin|start|talk|look)",
+    r"we're\s+going\s+to",
+    r"going\s+to\s+be\s+a",
+    r"hello\s+(?:everyone|everybody|class)",
+]
+
+# Earlier patterns take priority, so each is still tried in order; the union
+# only rules out the (common) sentences that match none of them in one pass
+_LECTURE_START_RE = [re.compile(p) for p in _LECTURE_START_PATTERNS]
+_LECTURE_START_UNION = re.compile("|".join(f"(?:{p})" for p in _LECTURE_START_PATTERNS))
+
+# Patterns that indicate post-lecture chatter (students asking questions, informal chat)
+# These mark where to STOP, not where the lecture ends
+_CHATTER_PATTERNS = [
+    r"^hey\.?$",  # Just "Hey." by itself
+    r"am i allowed to",
+    r"can i (?:ask|get)",
+    r"i love to have",
+    r"this is like doing",
+    r"^okay\.?$",  # Just "Okay." by itself at end
+    r"^yeah\.?$",  # Just "Yeah." by itself
+    r"^right\.?$",  # Just "Right." by itself
+    r"^sure\.?$",  # Just "Sure." by itself
+]
+
+_CHATTER_UNION = re.compile("|".join(f"(?:{p})" for p in _CHATTER_PATTERNS))
+
+# Common English words - coherent sentences must have several of these
+_COMMON_WORDS = frozenset({
+    'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+    'could', 'should', 'may', 'might', 'must', 'shall', 'can',
+    'to', 'of', 'in', 'for', 'on', 'with', 'at', 'by', 'from',
+    'this', 'that', 'these', 'those', 'it', 'its', 'you', 'your',
+    'we', 'our', 'they', 'their', 'i', 'my', 'me', 'he', 'she',
+    'and', 'or', 'but', 'if', 'so', 'as', 'what', 'which', 'who',
+    'how', 'when', 'where', 'why', 'all', 'each', 'every', 'both',
+    'few', 'more', 'most', 'other', 'some', 'such', 'no', 'not',
+    'only', 'same', 'than', 'too', 'very', 'just', 'also', 'now',
+    'here', 'there', 'then', 'once', 'going', 'want', 'need',
+    'like', 'know', 'think', 'see', 'get', 'make', 'take', 'come',
+    'right', 'okay', 'well', 'yeah', 'yes', 'really',
+    'today', 'already', 'use', 'using', 'copy', 'local', 'laptop',
+})
+
+# Filler phrases that are trimmed from the end of a transcript
+_TRAILING_FILLER = frozenset({
+    'thank you.', 'thank you', 'thanks.', 'thanks',
+    'thank you!', 'thanks!', 'bye.', 'bye', 'goodbye.',
+    'goodbye', 'see you.', 'see you', 'okay.', 'okay',
+    'alright.', 'alright', 'hey.', 'hey', 'yeah.', 'yeah',
+})
+
+# Words that mark a short closing sentence as informal chatter
+_INFORMAL_INDICATORS = ('okay', 'alright', 'hey', 'yeah', 'um', 'uh',
+                        'like', 'i mean', 'you know', 'right')
+
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+_WORD_RE = re.compile(r'\b[a-zA-Z]+\b')
+_WHITESPACE_RE = re.compile(r'\s+')
+_LEAD_PUNCT_RE = re.compile(r'^[,.\s]+')
 
 
 def check_dependencies():
     """Check if required dependencies are installed."""
     missing = []
 
-    # Check for whisper
+    # Check for faster-whisper
     try:
-        import whisper
+        import faster_whisper
     except ImportError:
-        missing.append("openai-whisper")
+        missing.append("faster-whisper")
 
     # Check for selenium
     try:
@@ -44,6 +164,12 @@ def check_dependencies():
     except ImportError:
         missing.append("selenium")
 
+    # Check for soundfile
+    try:
+        import soundfile
+    except ImportError:
+        missing.append("soundfile")
+
     # Check for webdriver_manager
     try:
         from webdriver_manager.chrome import ChromeDriverManager
@@ -85,18 +211,13 @@ def clean_m3u8_url(url: str) -> str:
     # These are typically: callback=jQuery..., responseFormat=jsonp, _=timestamp
     if "responseFormat=jsonp" in url or "callback=" in url:
         # Parse and rebuild the URL without problematic params
-        from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
-
         parsed = urlparse(url)
         params = parse_qs(parsed.query)
 
-        # Remove problematic parameters
-        params_to_remove = ['callback', 'responseFormat', '_']
-        for param in params_to_remove:
-            params.pop(param, None)
-
-        # Rebuild query string (parse_qs returns lists, so flatten them)
-        clean_params = {k: v[0] if len(v) == 1 else v for k, v in params.items()}
+        # Rebuild query string without the problematic parameters
+        # (parse_qs returns lists, so flatten them)
+        clean_params = {k: v[0] if len(v) == 1 else v
+                        for k, v in params.items() if k not in _PARAMS_TO_REMOVE}
         clean_query = urlencode(clean_params)
 
         # Rebuild URL
@@ -117,38 +238,54 @@ def is_valid_m3u8_url(url: str) -> bool:
     """
     Check if a URL is a valid m3u8 stream URL (not a JSONP request).
     """
-    # Skip JSONP callback URLs - they're API requests, not actual streams
-    if "callback=" in url and "responseFormat=jsonp" in url:
-        return False
+    # Must end with .m3u8 (before query params), and skip JSONP callback
+    # URLs - they're API requests, not actual streams
+    return bool(_M3U8_RE.search(url)) and not _JSONP_RE.match(url)
 
-    # Must end with .m3u8 or have .m3u8 in path (before query params)
-    if ".m3u8" in url:
-        return True
 
-    return False
+def _m3u8_score(url: str) -> int:
+    """
+    Rank a stream URL: 3 for a master/index playlist (the main playlist),
+    2 for a segment playlist (chunklist, media), 1 for anything else.
+    """
+    url = url.lower()
+    if "master.m3u8" in url or "index.m3u8" in url:
+        return 3
+    if "chunklist" in url or "media" in url or "segment" in url:
+        return 2
+    return 1
 
 
-def extract_m3u8_url(url: str, timeout: int = 60) -> str:
-    """
-    Use Selenium to load the UCSD podcast page and capture the m3u8 stream URL.
+_driver = None
+_driver_lock = threading.Lock()
 
-    Args:
-        url: The UCSD podcast URL
-        timeout: Maximum time to wait for the stream URL
 
-    Returns:
-        The m3u8 stream URL
+@functools.lru_cache(maxsize=1)
+def _chromedriver_path() -> str:
+    """Return the ChromeDriver binary, downloading it only if none is installed."""
+    path = shutil.which("chromedriver")
+    if path:
+        return path
+
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    return ChromeDriverManager().install()
+
+
+def _get_driver():
+    """
+    Return the shared headless Chrome driver, starting it on first use.
+
+    Chrome takes a few seconds to start, so one browser is kept for every
+    capture in the process. Callers must hold _driver_lock.
     """
+    global _driver
+    if _driver is not None:
+        return _driver
+
     from selenium import webdriver
     from selenium.webdriver.chrome.service import Service
     from selenium.webdriver.chrome.options import Options
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    from webdriver_manager.chrome import ChromeDriverManager
-
-    print(f"🌐 Loading podcast page: {url}")
-    print("   (This uses a headless browser to capture the video stream)")
 
     # Set up Chrome options
     chrome_options = Options()
@@ -163,8 +300,8 @@ def extract_m3u8_url(url: str, timeout: int = 60) -> str:
 
     # Initialize the driver
     try:
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        service = Service(_chromedriver_path())
+        _driver = webdriver.Chrome(service=service, options=chrome_options)
     except Exception as e:
         print(f"❌ Failed to initialize Chrome driver: {e}")
         print("\nTroubleshooting:")
@@ -172,92 +309,146 @@ def extract_m3u8_url(url: str, timeout: int = 60) -> str:
         print("2. Try: pip install --upgrade webdriver-manager selenium")
         raise
 
-    m3u8_url = None
-    all_m3u8_urls = []  # Collect all candidates
+    return _driver
 
-    try:
-        driver.get(url)
 
-        # Wait for page to load and video player to initialize
-        print("   Waiting for video player to load...")
-        time.sleep(5)
+def _reset_driver(driver):
+    """Clear the last podcast's page, cookies and network log before the next capture."""
+    driver.delete_all_cookies()
+    driver.get("about:blank")  # Also stops the video player streaming
+    driver.get_log("performance")
 
-        # Try to click play button if it exists
-        try:
-            play_buttons = driver.find_elements(By.CSS_SELECTOR,
-                "[class*='play'], [aria-label*='play'], button[title*='Play'], .playButton, .vjs-play-control, .largePlayBtn, [data-testid='play-button']")
-            for btn in play_buttons:
-                try:
-                    btn.click()
-                    print("   Clicked play button")
-                    time.sleep(3)
-                    break
-                except:
-                    pass
-        except:
-            pass
 
-        # Collect performance logs to find m3u8 URL
-        print("   Scanning network requests for video stream...")
+@atexit.register
+def quit_driver():
+    """
+    Close the shared browser, if one is running.
 
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            logs = driver.get_log("performance")
+    Registered with atexit; processes that end with os._exit() (such as RQ
+    work-horses) must call it themselves.
+    """
+    global _driver
+    if _driver is None:
+        return
 
-            for log in logs:
-                try:
-                    message = json.loads(log["message"])["message"]
+    try:
+        _driver.quit()
+    except Exception:
+        pass
+    _driver = None
+
+
+def extract_m3u8_url(url: str, timeout: int = 60) -> str:
+    """
+    Use Selenium to load the UCSD podcast page and capture the m3u8 stream URL.
 
-                    if message["method"] == "Network.requestWillBeSent":
-                        request_url = message["params"]["request"]["url"]
+    Args:
+        url: The UCSD podcast URL
+        timeout: Maximum time to wait for the stream URL
 
-                        # Look for m3u8 playlist URLs
-                        if ".m3u8" in request_url:
-                            # Skip JSONP callback URLs
-                            if "callback=" in request_url and "responseFormat=jsonp" in request_url:
-                                continue
+    Returns:
+        The m3u8 stream URL
+    """
+    from selenium.webdriver.common.by import By
 
-                            all_m3u8_urls.append(request_url)
+    print(f"🌐 Loading podcast page: {url}")
+    print("   (This uses a headless browser to capture the video stream)")
 
-                            # Prefer master/index m3u8 files (these are the main playlist)
-                            if any(x in request_url.lower() for x in ["master.m3u8", "index.m3u8"]):
-                                m3u8_url = request_url
-                                print(f"   ✅ Found master playlist!")
-                                break
-                            # Also look for segment playlists (chunklist, media)
-                            elif any(x in request_url.lower() for x in ["chunklist", "media", "segment"]):
-                                if not m3u8_url:
-                                    m3u8_url = request_url
+    # The shared browser handles one page at a time
+    with _driver_lock:
+        driver = _get_driver()
 
-                except (json.JSONDecodeError, KeyError):
-                    pass
+        m3u8_url = None
+        candidates = {}  # Stream URL -> _m3u8_score(), in the order they were requested
 
-            if m3u8_url:
-                break
+        try:
+            driver.get(url)
+
+            # Wait for page to load and video player to initialize
+            print("   Waiting for video player to load...")
+            time.sleep(5)
+
+            # Try to click play button if it exists
+            try:
+                play_buttons = driver.find_elements(By.CSS_SELECTOR,
+                    "[class*='play'], [aria-label*='play'], button[title*='Play'], .playButton, .vjs-play-control, .largePlayBtn, [data-testid='play-button']")
+                for btn in play_buttons:
+                    try:
+                        btn.click()
+                        print("   Clicked play button")
+                        time.sleep(3)
+                        break
+                    except:
+                        pass
+            except:
+                pass
+
+            # Collect performance logs to find m3u8 URL
+            print("   Scanning network requests for video stream...")
+
+            start_time = time.time()
+            while time.time() - start_time < timeout:
+                logs = driver.get_log("performance")
+
+                for log in logs:
+                    # Most log entries are unrelated requests; skip them without parsing
+                    if ".m3u8" not in log["message"]:
+                        continue
+
+                    try:
+                        message = json.loads(log["message"])["message"]
+
+                        if message["method"] == "Network.requestWillBeSent":
+                            request_url = message["params"]["request"]["url"]
+
+                            # Look for m3u8 playlist URLs, skipping JSONP callback URLs
+                            # (the substring test rejects most URLs before the regexes run)
+                            if ".m3u8" in request_url and is_valid_m3u8_url(request_url):
+                                candidates.setdefault(request_url, _m3u8_score(request_url))
+
+                                # A master playlist is the best we can do
+                                if candidates[request_url] == 3:
+                                    break
+
+                    except (json.JSONDecodeError, KeyError):
+                        pass
+
+                # Stop as soon as any stream shows up; the playlists are all
+                # requested together, so waiting longer doesn't find a better one
+                if candidates:
+                    break
 
-            time.sleep(1)
+                # get_log() drains the buffer, so each poll only sees new entries
+                time.sleep(0.1)
 
-        # If we didn't find a master playlist, use the first valid m3u8 we found
-        if not m3u8_url and all_m3u8_urls:
-            m3u8_url = all_m3u8_urls[0]
-            print(f"   ✅ Found video stream!")
+            # Use the best-scoring stream, the first one requested on a tie
+            if candidates:
+                m3u8_url = max(candidates, key=candidates.get)
+                if candidates[m3u8_url] == 3:
+                    print(f"   ✅ Found master playlist!")
+                else:
+                    print(f"   ✅ Found video stream!")
 
-        if not m3u8_url:
-            # Try to find it in page source as a fallback
-            page_source = driver.page_source
+            if not m3u8_url:
+                # Try to find it in page source as a fallback
+                page_source = driver.page_source
 
-            # Look for m3u8 URLs in the page source
-            m3u8_matches = re.findall(r'https?://[^\s"\'<>]+\.m3u8(?:\?[^\s"\'<>]*)?', page_source)
+                # Look for m3u8 URLs in the page source
+                m3u8_matches = re.findall(r'https?://[^\s"\'<>]+\.m3u8(?:\?[^\s"\'<>]*)?', page_source)
 
-            # Filter out JSONP URLs
-            valid_matches = [u for u in m3u8_matches if is_valid_m3u8_url(u)]
+                # Filter out JSONP URLs
+                valid_matches = [u for u in m3u8_matches if is_valid_m3u8_url(u)]
 
-            if valid_matches:
-                m3u8_url = valid_matches[0]
-                print(f"   ✅ Found video stream in page source!")
+                if valid_matches:
+                    m3u8_url = valid_matches[0]
+                    print(f"   ✅ Found video stream in page source!")
 
-    finally:
-        driver.quit()
+            _reset_driver(driver)
+
+        except Exception:
+            # Start a fresh browser next time rather than reuse a broken one
+            quit_driver()
+            raise
 
     if not m3u8_url:
         raise ValueError(
@@ -284,40 +475,82 @@ def download_with_ffmpeg(m3u8_url: str, output_path: str) -> str:
     """
     print(f"📥 Downloading audio stream...")
 
+    # Write 16 kHz mono 16-bit PCM, the format Whisper consumes, so there is
+    # no MP3 encode here and no decode/resample before transcription
     cmd = [
         "ffmpeg",
+        "-loglevel", "error",  # Only real errors in the log...
+        "-stats",  # ...plus the progress line
+        # Retry dropped HLS segment requests instead of failing the whole download
+        "-reconnect", "1",
+        "-reconnect_streamed", "1",
+        "-reconnect_delay_max", "5",
+        "-rw_timeout", "30000000",  # Give up on a stalled read after 30 s
         "-i", m3u8_url,
+        "-threads", str(os.cpu_count() or 1),
         "-vn",  # No video
-        "-acodec", "libmp3lame",  # MP3 codec
-        "-ab", "192k",  # Audio bitrate
+        "-ac", "1",  # Mono
+        "-ar", "16000",  # 16 kHz
+        "-c:a", "pcm_s16le",  # 16-bit PCM
+        "-f", "wav",
         "-y",  # Overwrite output
         output_path
     ]
 
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=600  # 10 minute timeout
-        )
-
-        if result.returncode != 0:
-            # FFmpeg writes to stderr even on success, check if file exists
-            if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
-                print(f"✅ Audio downloaded: {output_path}")
-                return output_path
-            else:
-                raise subprocess.CalledProcessError(result.returncode, cmd, result.stdout, result.stderr)
-
-        print(f"✅ Audio downloaded: {output_path}")
-        return output_path
-
-    except subprocess.TimeoutExpired:
-        raise TimeoutError("Download timed out after 10 minutes")
-    except subprocess.CalledProcessError as e:
-        print(f"❌ FFmpeg error: {e.stderr}")
-        raise
+    # Read FFmpeg's log as it is written instead of buffering the whole run;
+    # only the last non-progress lines are kept, for the error message
+    stderr_tail = deque(maxlen=20)
+    timed_out = threading.Event()
+
+    def kill():
+        timed_out.set()
+        process.kill()
+
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,  # Universal newlines also split the \r-terminated stats lines
+        errors="replace"
+    ) as process:
+        timer = threading.Timer(FFMPEG_TIMEOUT_SECONDS, kill)
+        timer.start()
+        progress = None
+        try:
+            for line in process.stderr:
+                match = _FFMPEG_TIME_RE.search(line)
+                if not match:
+                    stderr_tail.append(line.rstrip())
+
+                # Report progress once per minute of downloaded audio
+                elif match.group(1)[:-3] != progress:
+                    progress = match.group(1)[:-3]
+                    print(f"\r   Downloaded {match.group(1)} of audio", end="", flush=True)
+
+            returncode = process.wait()
+        except BaseException:
+            process.kill()
+            raise
+        finally:
+            timer.cancel()
+            if progress:
+                print()
+
+    if timed_out.is_set():
+        raise TimeoutError(f"Download timed out after {FFMPEG_TIMEOUT_SECONDS // 60} minutes")
+
+    if returncode != 0:
+        # FFmpeg writes to stderr even on success, check if file exists
+        if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
+            print(f"✅ Audio downloaded: {output_path}")
+            return output_path
+
+        stderr = "\n".join(stderr_tail)
+        print(f"❌ FFmpeg error: {stderr}")
+        raise subprocess.CalledProcessError(returncode, cmd, None, stderr)
+
+    print(f"✅ Audio downloaded: {output_path}")
+    return output_path
 
 
 def download_audio(url: str, output_dir: str) -> str:
@@ -338,7 +571,7 @@ def download_audio(url: str, output_dir: str) -> str:
 
         # Generate output filename
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_path = os.path.join(output_dir, f"podcast_{timestamp}.mp3")
+        output_path = os.path.join(output_dir, f"podcast_{timestamp}.wav")
 
         # Download with FFmpeg
         return download_with_ffmpeg(m3u8_url, output_path)
@@ -381,29 +614,172 @@ def download_with_ytdlp(url: str, output_dir: str) -> str:
     raise FileNotFoundError("Downloaded audio file not found")
 
 
-def transcribe_audio(audio_path: str, model_name: str = "base", language: str = None) -> str:
+# Fastest first. int8_float16 needs compute capability 7.0 (Volta and newer);
+# older GPUs fall back to INT8 with FP32 activations, or plain FP32. (BF16
+# needs 8.0, so it is never available where int8_float16 isn't.)
+COMPUTE_TYPE_PREFERENCE = {
+    "cuda": ("int8_float16", "int8", "float32"),
+    "cpu": ("int8", "float32"),
+}
+
+
+def detect_device(device: str = "auto") -> str:
+    """
+    Resolve the device to run Whisper on.
+
+    "auto" picks "cuda" if a CUDA GPU is available to CTranslate2, else "cpu";
+    any other value is returned unchanged.
     """
-    Transcribe audio using OpenAI Whisper.
+    if device != "auto":
+        return device
+
+    import ctranslate2
+
+    return "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+
+
+def select_compute_type(device: str) -> str:
+    """Return the fastest compute type this device supports."""
+    import ctranslate2
+
+    supported = ctranslate2.get_supported_compute_types(device)
+    for compute_type in COMPUTE_TYPE_PREFERENCE[device]:
+        if compute_type in supported:
+            return compute_type
+    return "default"
+
+
+class WhisperManager:
+    """
+    Process-wide cache for the loaded Whisper model.
+
+    Loading a model takes several seconds (longer on first download), so it
+    is kept between transcriptions and only reloaded when the device or
+    model size changes.
     """
-    import whisper
 
-    print(f"🔄 Loading Whisper model: {model_name}")
-    print("   (First run downloads the model, which may take a few minutes)")
+    _model = None
+    _device = None
+    _model_size = None
+    _lock = threading.RLock()  # The model may be preloaded from a background thread
 
-    model = whisper.load_model(model_name)
+    @classmethod
+    def get_model(cls, device: str, model_size: str):
+        """Return a loaded WhisperModel, loading it if needed."""
+        with cls._lock:
+            if cls._model is not None and (cls._device, cls._model_size) == (device, model_size):
+                return cls._model
+
+            from faster_whisper import WhisperModel
+
+            cls.unload()
+
+            compute_type = select_compute_type(device)
+
+            print(f"🔄 Loading Whisper model: {model_size} ({device}, {compute_type})")
+            print("   (First run downloads the model, which may take a few minutes)")
+
+            cls._model = WhisperModel(model_size, device=device, compute_type=compute_type)
+            cls._device = device
+            cls._model_size = model_size
+
+            if device == "cuda":
+                cls._warm_up()
+
+            return cls._model
+
+    @classmethod
+    def _warm_up(cls):
+        """
+        Run one tiny transcription so CUDA initialization (context, kernel
+        loading, memory pools) happens at load time, which may overlap the
+        download, rather than at the start of the first real transcription.
+        """
+        import numpy as np
+
+        silence = np.zeros(16000, dtype=np.float32)  # 1 second at 16 kHz
+        segments, _ = cls._model.transcribe(silence, language="en", beam_size=1)
+        list(segments)  # Decoding only runs as the generator is consumed
+
+    @classmethod
+    def unload(cls):
+        """
+        Drop the cached model.
+
+        Another thread may still be decoding with it (the web app runs several
+        jobs at once, each with its own model size), so the weights are not
+        unloaded explicitly; CTranslate2 frees them once the last user
+        releases its reference.
+        """
+        with cls._lock:
+            if cls._model is None:
+                return
+
+            cls._model = None
+            cls._device = None
+            cls._model_size = None
+            gc.collect()
+
+
+# Silero VAD settings for faster-whisper: pauses longer than half a second are
+# cut out before decoding, so Whisper doesn't hallucinate over dead air
+VAD_PARAMETERS = {"min_silence_duration_ms": 500}
+
+# Speech segments decoded together per batch when --batch-size isn't given.
+# Batching keeps a GPU busy; on CPU it mostly adds memory, so decode one at a time
+DEFAULT_BATCH_SIZE = {"cuda": 16, "cpu": 1}
+
+
+def transcribe_audio(
+    audio_path: str,
+    model_name: str = "base",
+    language: str = None,
+    device: str = "auto",
+    batch_size: int = None
+) -> str:
+    """
+    Transcribe audio using Whisper via faster-whisper (CTranslate2).
+
+    Runs with INT8 weights on CPU and INT8/FP16 on CUDA GPUs (see
+    COMPUTE_TYPE_PREFERENCE). The model is cached by WhisperManager, so later
+    calls skip the load. With a batch_size above 1, speech segments found by
+    VAD are decoded in batches through faster-whisper's BatchedInferencePipeline.
+    """
+    device = detect_device(device)
+    model = WhisperManager.get_model(device, model_name)
+    batch_size = batch_size or DEFAULT_BATCH_SIZE[device]
 
     print(f"🎙️ Transcribing audio...")
     print(f"   File: {audio_path}")
     print("   This may take a while depending on the audio length...")
 
-    options = {}
-    if language:
-        options["language"] = language
+    # WAV downloads are already 16 kHz mono, so load the samples directly
+    # instead of having faster-whisper decode and resample the file
+    audio = audio_path
+    if audio_path.endswith(".wav"):
+        import numpy as np
+        import soundfile as sf
+
+        with sf.SoundFile(audio_path) as f:
+            if f.samplerate == 16000 and f.channels == 1:
+                # Decode straight into one preallocated float32 buffer
+                audio = np.empty(f.frames, dtype=np.float32)
+                f.read(out=audio)
 
-    result = model.transcribe(audio_path, **options)
+    options = dict(language=language, vad_filter=True, vad_parameters=VAD_PARAMETERS, beam_size=5)
+
+    # Segments are decoded lazily as the generator is consumed
+    if batch_size > 1:
+        from faster_whisper import BatchedInferencePipeline
+
+        pipeline = BatchedInferencePipeline(model=model)
+        segments, info = pipeline.transcribe(audio, batch_size=batch_size, **options)
+    else:
+        segments, info = model.transcribe(audio, **options)
+    text = " ".join(segment.text.strip() for segment in segments)
 
     print("✅ Transcription complete!")
-    return result["text"]
+    return text
 
 
 def clean_transcript(text: str) -> str:
@@ -426,73 +802,35 @@ def clean_transcript(text: str) -> str:
     original_length = len(text)
 
     # First pass: remove obvious non-English characters and gibberish patterns
-    # These are common Whisper hallucination patterns
-    hallucination_patterns = [
-        r'[가-힣]+',  # Korean characters
-        r'[一-龯]+',  # Chinese characters
-        r'[ぁ-んァ-ン]+',  # Japanese characters
-        r'[а-яА-Я]+',  # Cyrillic characters
-        r'\b[A-Z]?[a-z]*[äöüáéíóúàèìòùâêîôûãõñ][a-z]*\b',  # Words with accented chars (hallucinations)
-        r"\b(sy'n|gyms|gyflen|newidda|roedd|gwilia|gyfly|canyan|ayag|teu|aun)\b",  # Welsh-like gibberish
-        r'\bIag\b',  # Common hallucination
-    ]
-
     cleaned_text = text
-    for pattern in hallucination_patterns:
-        cleaned_text = re.sub(pattern, '', cleaned_text, flags=re.IGNORECASE)
+    for pattern in _HALLUCINATION_PASSES:
+        cleaned_text = pattern.sub('', cleaned_text)
 
     # Split into sentences
-    sentences = re.split(r'(?<=[.!?])\s+', cleaned_text)
+    sentences = _SENTENCE_SPLIT_RE.split(cleaned_text)
 
     def is_coherent_english(s: str) -> bool:
-        """Check if a string is coherent English text (not just fragments)."""
+        """Check if an already-lowercased string is coherent English text (not just fragments)."""
         s = s.strip()
         if not s or len(s) < 10:
             return False
 
-        # Common English words - must have several of these
-        common_words = {'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been',
-                       'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-                       'could', 'should', 'may', 'might', 'must', 'shall', 'can',
-                       'to', 'of', 'in', 'for', 'on', 'with', 'at', 'by', 'from',
-                       'this', 'that', 'these', 'those', 'it', 'its', 'you', 'your',
-                       'we', 'our', 'they', 'their', 'i', 'my', 'me', 'he', 'she',
-                       'and', 'or', 'but', 'if', 'so', 'as', 'what', 'which', 'who',
-                       'how', 'when', 'where', 'why', 'all', 'each', 'every', 'both',
-                       'few', 'more', 'most', 'other', 'some', 'such', 'no', 'not',
-                       'only', 'same', 'than', 'too', 'very', 'just', 'also', 'now',
-                       'here', 'there', 'then', 'once', 'going', 'want', 'need',
-                       'like', 'know', 'think', 'see', 'get', 'make', 'take', 'come',
-                       'right', 'okay', 'well', 'yeah', 'yes', 'no', 'so', 'really',
-                       'today', 'already', 'use', 'using', 'copy', 'local', 'laptop'}
-
-        words = re.findall(r'\b[a-zA-Z]+\b', s.lower())
+        words = _WORD_RE.findall(s)
         if len(words) < 3:
             return False
 
-        english_word_count = sum(1 for w in words if w in common_words)
-
         # Need at least 3 common words OR 25% of words to be common
-        if english_word_count >= 3:
-            return True
-        if len(words) > 0 and english_word_count / len(words) >= 0.25:
-            return True
+        english_word_count = 0
+        for w in words:
+            if w in _COMMON_WORDS:
+                english_word_count += 1
+                if english_word_count >= 3:
+                    return True
 
-        return False
+        return english_word_count / len(words) >= 0.25
 
     # Find where real content starts (skip gibberish at beginning)
-    # Look for patterns that indicate lecture start - we'll use these to find the exact start point
-    lecture_start_patterns = [
-        r'(?:okay|alright|so|well|hey|hi|hello)?,?\s*my friends',
-        r'(?:okay|alright|so|well)?,?\s*today',
-        r'welcome\s+(?:to|back|everyone)',
-        r'(?:good\s+)?(?:morning|afternoon|evening)',
-        r"let's\s+(?:get\s+started|begin|start|talk|look)",
-        r"we're\s+going\s+to",
-        r"going\s+to\s+be\s+a",
-        r"hello\s+(?:everyone|everybody|class)",
-    ]
-
+    # Lecture-start patterns are used to find the exact start point
     start_index = 0
     start_char_offset = 0  # For trimming within the first sentence
 
@@ -500,22 +838,24 @@ def clean_transcript(text: str) -> str:
         sentence_lower = sentence.lower()
 
         # Check if this sentence has lecture-start indicators
-        for pattern in lecture_start_patterns:
-            match = re.search(pattern, sentence_lower)
-            if match:
-                # Found a lecture start pattern - trim everything before it
-                start_index = i
-                start_char_offset = match.start()
-                break
+        if _LECTURE_START_UNION.search(sentence_lower):
+            for pattern in _LECTURE_START_RE:
+                match = pattern.search(sentence_lower)
+                if match:
+                    # Found a lecture start pattern - trim everything before it
+                    start_index = i
+                    start_char_offset = match.start()
+                    break
 
         if start_char_offset > 0:
             break
 
         # Fallback: Look for a sentence that's clearly English and substantial
-        if is_coherent_english(sentence) and len(sentence) > 50:
+        if is_coherent_english(sentence_lower) and len(sentence) > 50:
             # Verify next couple sentences are also coherent
             if i + 2 < len(sentences):
-                if is_coherent_english(sentences[i + 1]) or is_coherent_english(sentences[i + 2]):
+                if (is_coherent_english(sentences[i + 1].lower())
+                        or is_coherent_english(sentences[i + 2].lower())):
                     start_index = i
                     break
             else:
@@ -524,29 +864,13 @@ def clean_transcript(text: str) -> str:
 
     # Find where real content ends (remove post-lecture chatter and repetitive endings)
     end_index = len(sentences)
-
-    # Patterns that indicate post-lecture chatter (students asking questions, informal chat)
-    # These mark where to STOP, not where the lecture ends
-    chatter_patterns = [
-        r"^hey\.?$",  # Just "Hey." by itself
-        r"am i allowed to",
-        r"can i (?:ask|get)",
-        r"i love to have",
-        r"this is like doing",
-        r"^okay\.?$",  # Just "Okay." by itself at end
-        r"^yeah\.?$",  # Just "Yeah." by itself
-        r"^right\.?$",  # Just "Right." by itself
-        r"^sure\.?$",  # Just "Sure." by itself
-    ]
+    lowered = [s.strip().lower() for s in sentences]
 
     # Find where chatter begins (scan from end backwards)
     chatter_start_index = None
     for i in range(len(sentences) - 1, max(0, len(sentences) - 30), -1):
-        sentence_lower = sentences[i].strip().lower()
-        for pattern in chatter_patterns:
-            if re.search(pattern, sentence_lower):
-                chatter_start_index = i
-                break
+        if _CHATTER_UNION.search(lowered[i]):
+            chatter_start_index = i
         if chatter_start_index:
             # Keep scanning backwards to find where chatter really starts
             continue
@@ -554,18 +878,13 @@ def clean_transcript(text: str) -> str:
     if chatter_start_index:
         end_index = chatter_start_index
 
-    # Remove trailing "Thank you" repetitions and short filler phrases
-    thank_you_variants = {'thank you.', 'thank you', 'thanks.', 'thanks',
-                         'thank you!', 'thanks!', 'bye.', 'bye', 'goodbye.',
-                         'goodbye', 'see you.', 'see you', 'okay.', 'okay',
-                         'alright.', 'alright', 'hey.', 'hey', 'yeah.', 'yeah'}
-
-    # Also remove short informal sentences at the end (post-lecture chatter)
+    # Remove trailing "Thank you" repetitions and short filler phrases,
+    # and short informal sentences at the end (post-lecture chatter)
     while end_index > start_index:
-        last_sentence = sentences[end_index - 1].strip().lower()
+        last_sentence = lowered[end_index - 1]
 
         # Remove known filler phrases
-        if last_sentence in thank_you_variants:
+        if last_sentence in _TRAILING_FILLER:
             end_index -= 1
             continue
 
@@ -575,28 +894,27 @@ def clean_transcript(text: str) -> str:
             continue
 
         # Remove sentences that are mostly informal/filler words
-        informal_indicators = ['okay', 'alright', 'hey', 'yeah', 'um', 'uh',
-                              'like', 'i mean', 'you know', 'right']
         word_count = len(last_sentence.split())
-        informal_count = sum(1 for ind in informal_indicators if ind in last_sentence)
+        informal_count = sum(1 for ind in _INFORMAL_INDICATORS if ind in last_sentence)
         if word_count < 10 and informal_count >= 2:
             end_index -= 1
             continue
 
         break
 
-    # Check for repetitive patterns at the end
+    # Check for repetitive patterns at the end: grow the tail window one
+    # sentence at a time and cut at the shortest window (3+ sentences) where
+    # one sentence makes up at least 60% of it
     if end_index > start_index + 5:
+        counts = Counter()
+        max_count = 0
         for i in range(end_index - 1, max(end_index - 15, start_index), -1):
-            remaining = [s.strip().lower() for s in sentences[i:end_index]]
-            if len(remaining) >= 3:
-                # Check if most are the same
-                from collections import Counter
-                counts = Counter(remaining)
-                most_common, count = counts.most_common(1)[0]
-                if count >= len(remaining) * 0.6:
-                    end_index = i
-                    break
+            counts[lowered[i]] += 1
+            max_count = max(max_count, counts[lowered[i]])
+            window = end_index - i
+            if window >= 3 and max_count >= window * 0.6:
+                end_index = i
+                break
 
     # Reconstruct the cleaned transcript
     cleaned_sentences = sentences[start_index:end_index]
@@ -608,8 +926,8 @@ def clean_transcript(text: str) -> str:
     cleaned_text = ' '.join(cleaned_sentences)
 
     # Final cleanup: extra whitespace and leading punctuation
-    cleaned_text = re.sub(r'\s+', ' ', cleaned_text).strip()
-    cleaned_text = re.sub(r'^[,.\s]+', '', cleaned_text)  # Remove leading commas/periods
+    cleaned_text = _WHITESPACE_RE.sub(' ', cleaned_text).strip()
+    cleaned_text = _LEAD_PUNCT_RE.sub('', cleaned_text)  # Remove leading commas/periods
 
     removed_chars = original_length - len(cleaned_text)
     if removed_chars > 0:
@@ -631,18 +949,44 @@ def save_transcript(text: str, output_path: str) -> str:
     return output_path
 
 
+def _run_in_daemon_thread(fn, *args) -> Future:
+    """
+    Run fn(*args) on a daemon thread and return a Future for its result.
+
+    ThreadPoolExecutor joins its threads at interpreter exit, so after Ctrl+C
+    or a failed download the CLI would hang until the model finished loading
+    (several GB on first use); a daemon thread is simply dropped.
+    """
+    future = Future()
+
+    def run():
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
 def transcribe_podcast(
     url: str,
     output_path: str = None,
     model: str = "base",
     language: str = None,
-    keep_audio: bool = False
+    keep_audio: bool = False,
+    device: str = "auto",
+    batch_size: int = None
 ) -> str:
     """
     Main function to download and transcribe a podcast.
     """
     check_dependencies()
 
+    # Load the Whisper model in the background while the page is captured and
+    # the audio downloads; both take several seconds and don't depend on each other
+    model_future = _run_in_daemon_thread(WhisperManager.get_model, detect_device(device), model)
+
     with tempfile.TemporaryDirectory() as temp_dir:
         if keep_audio:
             audio_dir = os.getcwd()
@@ -652,8 +996,9 @@ def transcribe_podcast(
         # Download audio
         audio_path = download_audio(url, audio_dir)
 
-        # Transcribe
-        transcript = transcribe_audio(audio_path, model, language)
+        # Transcribe (the model is cached once the preload finishes)
+        model_future.result()
+        transcript = transcribe_audio(audio_path, model, language, device, batch_size)
 
         # Clean up hallucinations and gibberish
         transcript = clean_transcript(transcript)
@@ -661,7 +1006,7 @@ def transcribe_podcast(
         # Generate output path if not provided
         if not output_path:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_path = f"/Users/atjon/Desktop/Code/COGS108Lectures/transcript_{timestamp}.txt"
+            output_path = os.path.join(DEFAULT_OUTPUT_DIR, f"transcript_{timestamp}.txt")
 
         # Save transcript
         save_transcript(transcript, output_path)
@@ -675,6 +1020,86 @@ def transcribe_podcast(
         return transcript
 
 
+def transcribe_batch(
+    urls: list,
+    output_dir: str = None,
+    model: str = "base",
+    language: str = None,
+    keep_audio: bool = False,
+    device: str = "auto",
+    batch_size: int = None
+) -> list:
+    """
+    Transcribe several podcasts, sharing one loaded Whisper model.
+
+    Up to BATCH_DOWNLOAD_WORKERS podcasts are downloaded in parallel while
+    this thread transcribes each one as soon as its audio is ready, so only
+    one model (and GPU context) is ever in use.
+
+    A failed URL is reported and skipped so the rest of the batch still runs.
+
+    Returns:
+        List of transcripts in the same order as urls (None for failures)
+    """
+    check_dependencies()
+
+    output_dir = output_dir or DEFAULT_OUTPUT_DIR
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    transcripts = [None] * len(urls)
+    ready = queue.Queue()  # (index, url, audio_path, error) as downloads finish
+
+    def download(i, url, audio_dir):
+        try:
+            ready.put((i, url, download_audio(url, audio_dir), None))
+        except Exception as e:
+            ready.put((i, url, None, e))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        downloader = ThreadPoolExecutor(max_workers=BATCH_DOWNLOAD_WORKERS)
+        try:
+            for i, url in enumerate(urls, 1):
+                # One folder per podcast, since downloads are named by timestamp
+                audio_dir = os.path.join(temp_dir, str(i))
+                os.mkdir(audio_dir)
+                downloader.submit(download, i, url, audio_dir)
+
+            # Load the model while the first downloads run
+            WhisperManager.get_model(detect_device(device), model)
+
+            for _ in urls:
+                i, url, audio_path, error = ready.get()
+                print(f"\n[{i}/{len(urls)}] {url}")
+                if error is not None:
+                    print(f"❌ Failed to transcribe {url}: {error}")
+                    continue
+
+                try:
+                    transcript = transcribe_audio(audio_path, model, language, device, batch_size)
+                    transcript = clean_transcript(transcript)
+                    save_transcript(transcript, os.path.join(output_dir, f"transcript_{timestamp}_{i}.txt"))
+                    transcripts[i - 1] = transcript
+                except Exception as e:
+                    print(f"❌ Failed to transcribe {url}: {e}")
+
+                if keep_audio:
+                    extension = os.path.splitext(audio_path)[1]
+                    kept_path = os.path.join(os.getcwd(), f"podcast_{timestamp}_{i}{extension}")
+                    shutil.move(audio_path, kept_path)
+                    print(f"🎵 Audio file kept at: {kept_path}")
+                else:
+                    # Free the disk space now rather than at the end of the batch
+                    os.remove(audio_path)
+        except BaseException:
+            # On Ctrl+C or a failed model load, don't wait for every queued
+            # podcast to be captured and downloaded first
+            downloader.shutdown(wait=False, cancel_futures=True)
+            raise
+        downloader.shutdown()
+
+    return transcripts
+
+
 def main():
     """Command-line interface."""
     parser = argparse.ArgumentParser(
@@ -685,6 +1110,7 @@ Examples:
   %(prog)s "https://podcast.ucsd.edu/watch/wi26/cogs108_b00/6"
   %(prog)s "https://podcast.ucsd.edu/watch/wi26/cogs108_b00/6" --model medium
   %(prog)s "https://youtube.com/watch?v=xxx" -o my_transcript.txt
+  %(prog)s URL1 URL2 URL3 -o lectures/
 
 Whisper Models:
   tiny    - Fastest, least accurate (~1GB VRAM)
@@ -692,16 +1118,23 @@ Whisper Models:
   small   - Better accuracy (~2GB VRAM)
   medium  - High accuracy (~5GB VRAM)
   large   - Best accuracy, slowest (~10GB VRAM)
+  large-v3 - Same as large (latest large weights)
         """
     )
 
-    parser.add_argument("url", help="URL of the podcast to transcribe")
-    parser.add_argument("-o", "--output", help="Output file path")
+    parser.add_argument("urls", nargs="+", metavar="url",
+                       help="URL(s) of the podcast(s) to transcribe")
+    parser.add_argument("-o", "--output",
+                       help="Output file path (output folder when several URLs are given)")
     parser.add_argument("-m", "--model", default="base",
-                       choices=["tiny", "base", "small", "medium", "large"])
+                       choices=["tiny", "base", "small", "medium", "large", "large-v3"])
     parser.add_argument("-l", "--language", help="Language code (e.g., 'en')")
     parser.add_argument("--keep-audio", action="store_true",
                        help="Keep the downloaded audio file")
+    parser.add_argument("--device", default="auto", choices=["auto", "cpu", "cuda"],
+                       help="Device to run Whisper on (default: auto)")
+    parser.add_argument("--batch-size", type=int,
+                       help="Speech segments decoded per batch (default: 16 on CUDA, 1 on CPU)")
 
     args = parser.parse_args()
 
@@ -711,12 +1144,32 @@ Whisper Models:
     print()
 
     try:
+        if len(args.urls) > 1:
+            transcripts = transcribe_batch(
+                urls=args.urls,
+                output_dir=args.output,
+                model=args.model,
+                language=args.language,
+                keep_audio=args.keep_audio,
+                device=args.device,
+                batch_size=args.batch_size
+            )
+
+            failed = sum(1 for t in transcripts if t is None)
+            print()
+            print(f"✨ Done! {len(transcripts) - failed}/{len(transcripts)} transcribed")
+            if failed:
+                sys.exit(1)
+            return
+
         transcript = transcribe_podcast(
-            url=args.url,
+            url=args.urls[0],
             output_path=args.output,
             model=args.model,
             language=args.language,
-            keep_audio=args.keep_audio
+            keep_audio=args.keep_audio,
+            device=args.device,
+            batch_size=args.batch_size
         )
 
         print()